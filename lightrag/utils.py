@@ -5241,6 +5241,11 @@ def convert_to_user_format(
 ) -> dict[str, Any]:
     """Convert internal data format to user-friendly format using original database data"""
 
+    # Empty results (bypass mode, missing tokenizer, retrieval misses) skip
+    # the per-item conversion and the debug log below
+    if not (entities_context or relations_context or chunks or references):
+        return _build_user_format_result([], [], [], [], query_mode)
+
     # Convert entities format using original data when available
     formatted_entities = []
     for entity in entities_context:
@@ -5318,20 +5323,41 @@ def convert_to_user_format(
             )
 
     # Convert chunks format (chunks already contain complete data)
-    formatted_chunks = []
-    for i, chunk in enumerate(chunks):
-        chunk_data = {
+    formatted_chunks = [
+        {
             "reference_id": chunk.get("reference_id", ""),
             "content": chunk.get("content", ""),
             "file_path": chunk.get("file_path", "unknown_source"),
             "chunk_id": chunk.get("chunk_id", ""),
         }
-        formatted_chunks.append(chunk_data)
+        for chunk in chunks
+    ]
 
     logger.debug(
         f"[convert_to_user_format] Formatted {len(formatted_chunks)}/{len(chunks)} chunks"
     )
 
+    return _build_user_format_result(
+        formatted_entities,
+        formatted_relationships,
+        formatted_chunks,
+        references,
+        query_mode,
+    )
+
+
+def _build_user_format_result(
+    entities: list[dict],
+    relationships: list[dict],
+    chunks: list[dict],
+    references: list[dict],
+    query_mode: str,
+) -> dict[str, Any]:
+    """Assemble the result skeleton returned by convert_to_user_format.
+
+    A fresh dict is built on every call because callers mutate the result
+    (status, message, metadata) after conversion.
+    """
     # Build basic metadata (metadata details will be added by calling functions)
     metadata = {
         "query_mode": query_mode,
@@ -5345,9 +5371,9 @@ def convert_to_user_format(
         "status": "success",
         "message": "Query processed successfully",
         "data": {
-            "entities": formatted_entities,
-            "relationships": formatted_relationships,
-            "chunks": formatted_chunks,
+            "entities": entities,
+            "relationships": relationships,
+            "chunks": chunks,
             "references": references,
         },
         "metadata": metadata,
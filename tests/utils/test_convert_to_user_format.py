@@ -0,0 +1,74 @@
+"""``convert_to_user_format`` — the structured ``data`` payload of query results."""
+
+import pytest
+
+from lightrag.utils import convert_to_user_format
+
+pytestmark = pytest.mark.offline
+
+
+def test_chunks_are_projected_to_standard_fields():
+    chunks = [
+        {
+            "reference_id": "1",
+            "content": "alpha",
+            "file_path": "a.txt",
+            "chunk_id": "chunk-a",
+            "tokens": 12,
+        },
+        {"content": "beta"},
+    ]
+
+    result = convert_to_user_format([], [], chunks, [], "naive")
+
+    assert result["data"]["chunks"] == [
+        {
+            "reference_id": "1",
+            "content": "alpha",
+            "file_path": "a.txt",
+            "chunk_id": "chunk-a",
+        },
+        {
+            "reference_id": "",
+            "content": "beta",
+            "file_path": "unknown_source",
+            "chunk_id": "",
+        },
+    ]
+
+
+def test_chunk_order_and_input_are_preserved():
+    chunks = [{"chunk_id": f"chunk-{i}", "content": str(i)} for i in range(5)]
+    snapshot = [dict(chunk) for chunk in chunks]
+
+    result = convert_to_user_format([], [], chunks, [], "mix")
+
+    assert [c["chunk_id"] for c in result["data"]["chunks"]] == [
+        f"chunk-{i}" for i in range(5)
+    ]
+    assert chunks == snapshot
+
+
+def test_empty_inputs_return_fresh_mutable_skeleton():
+    first = convert_to_user_format([], [], [], [], "bypass")
+    # Callers overwrite status/message and extend metadata in place.
+    first["status"] = "failure"
+    first["metadata"]["keywords"]["high_level"].append("leak")
+    first["data"]["chunks"].append({"chunk_id": "leak"})
+
+    second = convert_to_user_format([], [], [], [], "bypass")
+
+    assert second == {
+        "status": "success",
+        "message": "Query processed successfully",
+        "data": {
+            "entities": [],
+            "relationships": [],
+            "chunks": [],
+            "references": [],
+        },
+        "metadata": {
+            "query_mode": "bypass",
+            "keywords": {"high_level": [], "low_level": []},
+        },
+    }